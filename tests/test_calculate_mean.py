@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 import weather
 
 
@@ -31,3 +32,22 @@ class CalculateMeanTests(unittest.TestCase):
         expected_result = -52.5
         result = weather.calculate_mean(temperatures)
         self.assertEqual(result, expected_result)
+
+    def test_calculate_mean_iterator(self):
+        temperatures = iter([1, 2])
+        expected_result = 1.5
+        result = weather.calculate_mean(temperatures)
+        self.assertEqual(result, expected_result)
+
+    def test_calculate_mean_mixed(self):
+        temperatures = [1, "2"]
+        expected_result = 1.5
+        result = weather.calculate_mean(temperatures)
+        self.assertEqual(result, expected_result)
+
+    def test_calculate_mean_decimals(self):
+        temperatures = [Decimal("1"), Decimal("2")]
+        expected_result = 1.5
+        result = weather.calculate_mean(temperatures)
+        self.assertIsInstance(result, float)
+        self.assertEqual(result, expected_result)
@@ -46,3 +46,27 @@ class ConvertDateTests(unittest.TestCase):
         expected_result = "Sunday 31 October 2021"
         result = weather.convert_date(date)
         self.assertEqual(result, expected_result)
+
+    def test_convert_date_date_only(self):
+        date = "2021-07-06"
+        expected_result = "Tuesday 06 July 2021"
+        result = weather.convert_date(date)
+        self.assertEqual(result, expected_result)
+
+    def test_convert_date_basic_format(self):
+        date = "20210706"
+        expected_result = "Tuesday 06 July 2021"
+        result = weather.convert_date(date)
+        self.assertEqual(result, expected_result)
+
+    def test_convert_date_malformed(self):
+        with self.assertRaises(ValueError):
+            weather.convert_date("2021/07/06")
+        with self.assertRaises(ValueError):
+            weather.convert_date("2021-07-06x")
+        with self.assertRaises(ValueError):
+            weather.convert_date("+021-07-06")
+        with self.assertRaises(ValueError):
+            weather.convert_date("2021-07-06 junk")
+        with self.assertRaises(ValueError):
+            weather.convert_date("2021-07-6 ")
@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 import weather
 
 
@@ -31,3 +32,9 @@ class ConvertTempTests(unittest.TestCase):
         expected_result = 25.0
         result = weather.convert_f_to_c(temp_in_f)
         self.assertEqual(result, expected_result)
+
+    def test_convert_f_to_c_decimal(self):
+        temp_in_f = Decimal("50")
+        expected_result = 10.0
+        result = weather.convert_f_to_c(temp_in_f)
+        self.assertEqual(result, expected_result)
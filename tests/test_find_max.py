@@ -32,6 +32,24 @@ class FindMaxTests(unittest.TestCase):
         result = weather.find_max(temperatures)
         self.assertEqual(result, expected_result)
 
+    def test_find_max_mixed(self):
+        temperatures = [3, "5"]
+        expected_result = (5.0, 1)
+        result = weather.find_max(temperatures)
+        self.assertEqual(result, expected_result)
+
+    def test_find_max_iterator(self):
+        temperatures = iter([3, 1])
+        expected_result = (3.0, 0)
+        result = weather.find_max(temperatures)
+        self.assertEqual(result, expected_result)
+
+    def test_find_max_strings_compared_as_numbers(self):
+        temperatures = ["100", "49", "57"]
+        expected_result = (100.0, 0)
+        result = weather.find_max(temperatures)
+        self.assertEqual(result, expected_result)
+
     def test_find_max_empty_list(self):
         temperatures = []
         expected_result = ()
@@ -32,6 +32,24 @@ class FindMinTests(unittest.TestCase):
         result = weather.find_min(temperatures)
         self.assertEqual(result, expected_result)
 
+    def test_find_min_mixed(self):
+        temperatures = [3, "5"]
+        expected_result = (3.0, 0)
+        result = weather.find_min(temperatures)
+        self.assertEqual(result, expected_result)
+
+    def test_find_min_iterator(self):
+        temperatures = iter([3, 1])
+        expected_result = (1.0, 1)
+        result = weather.find_min(temperatures)
+        self.assertEqual(result, expected_result)
+
+    def test_find_min_strings_compared_as_numbers(self):
+        temperatures = ["100", "49", "57"]
+        expected_result = (49.0, 1)
+        result = weather.find_min(temperatures)
+        self.assertEqual(result, expected_result)
+
     def test_find_min_empty_list(self):
         temperatures = []
         expected_result = ()
@@ -0,0 +1,33 @@
+import unittest
+import weather
+
+
+class FormatTemperatureTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_format_temperature(self):
+        temp = 20.0
+        expected_result = "20.0°C"
+        result = weather.format_temperature(temp)
+        self.assertEqual(result, expected_result)
+
+    def test_format_temperature_rounds(self):
+        temp = 12.2222
+        expected_result = "12.2°C"
+        result = weather.format_temperature(temp)
+        self.assertEqual(result, expected_result)
+
+    def test_format_temperature_negative(self):
+        temp = -46.67
+        expected_result = "-46.7°C"
+        result = weather.format_temperature(temp)
+        self.assertEqual(result, expected_result)
+
+    def test_format_temperature_string(self):
+        temp = "18"
+        expected_result = "18.0°C"
+        result = weather.format_temperature(temp)
+        self.assertEqual(result, expected_result)
@@ -52,3 +52,26 @@ class GenerateDailySummaryTests(unittest.TestCase):
             expected_result = txt_file.read()
         result = weather.generate_daily_summary(self.example_three)
         self.assertEqual(expected_result, result)
+
+    def test_generate_summary_many_days(self):
+        # Enough days to use the parallel path (when there is more than one CPU) -
+        # it should match formatting the days in small batches.
+        days = [
+            [f"{year}-{month:02d}-{day:02d}T07:00:00+08:00", (year + month * day) % 60, (year + month * day) % 60 + 20]
+            for year in range(1940, 2010)
+            for month in range(1, 13)
+            for day in range(1, 29)
+        ]
+        self.assertGreaterEqual(len(days), weather.PARALLEL_DAILY_SUMMARY_THRESHOLD)
+        expected_result = "".join(
+            weather.generate_daily_summary(days[i:i + 1000]) for i in range(0, len(days), 1000)
+        )
+        result = weather.generate_daily_summary(days, parallel=True)
+        self.assertEqual(expected_result, result)
+        self.assertEqual(expected_result, weather.generate_daily_summary(days))
+
+    def test_generate_summary_extra_column(self):
+        with open("tests/expected_output/example_one_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.generate_daily_summary([day + ["extra"] for day in self.example_one])
+        self.assertEqual(expected_result, result)
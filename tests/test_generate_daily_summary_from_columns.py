@@ -0,0 +1,30 @@
+import unittest
+import weather
+
+
+class GenerateDailySummaryFromColumnsTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_generate_daily_summary_from_columns_example_one(self):
+        with open("tests/expected_output/example_one_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        dates, min_temps, max_temps = weather.load_columns_from_csv("tests/data/example_one.csv")
+        result = weather.generate_daily_summary_from_columns(dates, min_temps, max_temps)
+        self.assertEqual(expected_result, result)
+
+    def test_generate_daily_summary_from_columns_example_two(self):
+        with open("tests/expected_output/example_two_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        dates, min_temps, max_temps = weather.load_columns_from_csv("tests/data/example_two.csv")
+        result = weather.generate_daily_summary_from_columns(dates, min_temps, max_temps)
+        self.assertEqual(expected_result, result)
+
+    def test_generate_daily_summary_from_columns_example_three(self):
+        with open("tests/expected_output/example_three_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        dates, min_temps, max_temps = weather.load_columns_from_csv("tests/data/example_three.csv")
+        result = weather.generate_daily_summary_from_columns(dates, min_temps, max_temps)
+        self.assertEqual(expected_result, result)
@@ -52,3 +52,9 @@ class GenerateSummaryTests(unittest.TestCase):
             expected_result = txt_file.read()
         result = weather.generate_summary(self.example_three)
         self.assertEqual(expected_result, result)
+
+    def test_generate_summary_extra_column(self):
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.generate_summary([day + ["extra"] for day in self.example_one])
+        self.assertEqual(expected_result, result)
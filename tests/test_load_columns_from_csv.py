@@ -0,0 +1,56 @@
+import unittest
+import weather
+
+
+class LoadColumnsCSVTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_one = (
+            [
+                "2021-07-02T07:00:00+08:00",
+                "2021-07-03T07:00:00+08:00",
+                "2021-07-04T07:00:00+08:00",
+                "2021-07-05T07:00:00+08:00",
+                "2021-07-06T07:00:00+08:00"
+            ],
+            [49, 57, 56, 55, 53],
+            [67, 68, 62, 61, 62]
+        )
+        self.example_three = (
+            [
+                "2020-06-19T07:00:00+08:00",
+                "2020-06-20T07:00:00+08:00",
+                "2020-06-21T07:00:00+08:00",
+                "2020-06-22T07:00:00+08:00",
+                "2020-06-23T07:00:00+08:00",
+                "2020-06-24T07:00:00+08:00",
+                "2020-06-25T07:00:00+08:00",
+                "2020-06-26T07:00:00+08:00"
+            ],
+            [-47, -51, 58, 59, -52, 52, -48, 53],
+            [-46, 67, 72, 71, 71, 67, 66, 66]
+        )
+
+    def test_load_columns_csv_file(self):
+        dates, min_temps, max_temps = weather.load_columns_from_csv("tests/data/example_one.csv")
+        self.assertListEqual(list(dates), self.example_one[0])
+        self.assertListEqual(list(min_temps), self.example_one[1])
+        self.assertListEqual(list(max_temps), self.example_one[2])
+
+        dates, min_temps, max_temps = weather.load_columns_from_csv("tests/data/example_three.csv")
+        self.assertListEqual(list(dates), self.example_three[0])
+        self.assertListEqual(list(min_temps), self.example_three[1])
+        self.assertListEqual(list(max_temps), self.example_three[2])
+
+    def test_load_columns_matches_load_data(self):
+        dates, min_temps, max_temps = weather.load_columns_from_csv("tests/data/example_two.csv")
+        rows = [list(day) for day in zip(dates, min_temps, max_temps)]
+        self.assertListEqual(rows, weather.load_data_from_csv("tests/data/example_two.csv"))
+
+    def test_load_columns_temperatures_work_with_helpers(self):
+        dates, min_temps, max_temps = weather.load_columns_from_csv("tests/data/example_one.csv")
+        self.assertEqual(weather.find_min(min_temps), (49.0, 0))
+        self.assertEqual(weather.find_max(max_temps), (68.0, 1))
+        self.assertEqual(weather.calculate_mean(min_temps), 54)
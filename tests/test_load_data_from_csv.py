@@ -44,3 +44,7 @@ class LoadCSVTests(unittest.TestCase):
 
         result = weather.load_data_from_csv("tests/data/example_three.csv")
         self.assertListEqual(result, self.example_three)
+
+    def test_load_csv_file_quoted_fields(self):
+        result = weather.load_data_from_csv("tests/data/example_quoted.csv")
+        self.assertListEqual(result, self.example_one[:2])
@@ -0,0 +1,26 @@
+import unittest
+import weather
+
+
+class LoadCSVIterTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_one = [
+            ["2021-07-02T07:00:00+08:00", 49, 67],
+            ["2021-07-03T07:00:00+08:00", 57, 68],
+            ["2021-07-04T07:00:00+08:00", 56, 62],
+            ["2021-07-05T07:00:00+08:00", 55, 61],
+            ["2021-07-06T07:00:00+08:00", 53, 62]
+        ]
+
+    def test_load_csv_iter_one_day_at_a_time(self):
+        days = weather.load_data_from_csv_iter("tests/data/example_one.csv")
+        self.assertListEqual(next(days), self.example_one[0])
+        self.assertListEqual(next(days), self.example_one[1])
+        self.assertListEqual(list(days), self.example_one[2:])
+
+    def test_load_csv_iter_matches_load_data(self):
+        result = list(weather.load_data_from_csv_iter("tests/data/example_three.csv"))
+        self.assertListEqual(result, weather.load_data_from_csv("tests/data/example_three.csv"))
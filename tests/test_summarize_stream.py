@@ -0,0 +1,27 @@
+import unittest
+import weather
+
+
+class SummarizeStreamTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_summarize_stream_example_one(self):
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.summarize_stream("tests/data/example_one.csv")
+        self.assertEqual(expected_result, result)
+
+    def test_summarize_stream_example_two(self):
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.summarize_stream("tests/data/example_two.csv")
+        self.assertEqual(expected_result, result)
+
+    def test_summarize_stream_example_three(self):
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.summarize_stream("tests/data/example_three.csv")
+        self.assertEqual(expected_result, result)
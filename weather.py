@@ -1,7 +1,23 @@
 import csv
+import os
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 DEGREE_SYMBOL = u"\N{DEGREE SIGN}C"
+# Day and month names used by convert_date e.g. Tuesday 06 July 2021.
+# Looked up by position instead of asking strftime(), which goes through the system locale on every call.
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTH_NAMES = (
+    None, "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+# With parallel=True, generate_daily_summary only splits the work across processes from this many days up.
+# Formatting one day takes about 7 microseconds, while starting the pool and sending each day
+# to it and back costs roughly 10 ms plus 2 microseconds a day, so smaller inputs are quicker done in one process.
+PARALLEL_DAILY_SUMMARY_THRESHOLD = 20000
 
 
 def format_temperature(temp):
@@ -9,14 +25,18 @@ def format_temperature(temp):
         and Celcius symbols.
 
     Args:
-        temp: A string representing a temperature.
+        temp: A string or number representing a temperature.
     Returns:
-        A string contain the temperature and "degrees Celcius."
+        A string contain the temperature (to 1 decimal place) and "degrees Celcius."
     """
 
-    return f"{temp}{DEGREE_SYMBOL}"
+    # The :.1f format spec rounds and turns the number into text in one step, so callers don't need round() first.
+    return f"{float(temp):.1f}{DEGREE_SYMBOL}"
 
 
+# The same date string can be converted more than once (generate_summary looks up the min/max dates again),
+# so lru_cache remembers recent results and skips parsing/formatting on a repeat.
+@lru_cache(maxsize=4096)
 def convert_date(iso_string):
     """Converts and ISO formatted date into a human-readable format.
 
@@ -26,11 +46,16 @@ def convert_date(iso_string):
         A date formatted like: Weekday Date Month Year e.g. Tuesday 06 July 2021
     """
 
-    # The fromisoformat() method in Python's datetime module formats datetime objects into strings using specific format codes
+    # The fromisoformat() method in Python's datetime module reads ISO strings (with or without a time and timezone)
+    # and raises a ValueError for anything malformed. It runs in C, so it is quicker than slicing the string by hand.
     iso_readable = datetime.fromisoformat(iso_string)
 
-    # The strftime() method in Python's datetime module is used to format datetime objects into readable strings based on specified format codes.
-    return iso_readable.strftime("%A %d %B %Y")
+    # weekday() gives 0 for Monday to 6 for Sunday, and month goes from 1 to 12, so both index straight into the name tables.
+    # :02d pads the day with a leading zero e.g. 06.
+    return (
+        f"{WEEKDAY_NAMES[iso_readable.weekday()]} {iso_readable.day:02d} "
+        f"{MONTH_NAMES[iso_readable.month]} {iso_readable.year}"
+    )
 
 
 
@@ -39,11 +64,14 @@ def convert_f_to_c(temp_in_fahrenheit):
     """Converts a temperature from Fahrenheit to Celcius.
 
     Args:
-        temp_in_fahrenheit: float representing a temperature.
+        temp_in_fahrenheit: float, int or anything float() accepts (e.g. a numeric string) representing a temperature.
     Returns:
         A float representing a temperature in degrees Celcius, rounded to 1 decimal place.
     """
-    temp_in_fahrenheit = float(temp_in_fahrenheit) 
+    # Ints from the csv loader can go straight into the maths below (multiplying by 5.0 turns them into a float once),
+    # so only other types (strings, Decimals, bytes...) need converting first.
+    if not isinstance(temp_in_fahrenheit, (int, float)):
+        temp_in_fahrenheit = float(temp_in_fahrenheit)
 
     # To convert Fahrenheit to Celsius, subtract 32 from the Fahrenheit temperature and then divide the result by 1.8
     temp_in_celsius = (temp_in_fahrenheit - 32) * 5.0 / 9.0
@@ -58,20 +86,29 @@ def calculate_mean(weather_data):
     """Calculates the mean value from a list of numbers.
 
     Args:
-        weather_data: a list of numbers.
+        weather_data: a list (or any iterable) of numbers or numeric strings.
     Returns:
         A float representing the mean value.
     """
 
+    # sum() and len() below need a list-like input, so anything else (e.g. an iterator) is turned into a list first
+    if not isinstance(weather_data, Sequence):
+        weather_data = list(weather_data)
+
     # Got a ZeroDivisionError because list was empty so gave it a 0.0 float in this case.
     if not weather_data:
         return 0.0  
     
-    # Convert all values to float as we look through the weather_data list
-    # Uses list comprehension - quick way to build a new list in one line which is assigns to 'numbers'
-    numbers = [float(temp) for temp in weather_data]
-    # Add up all the numbers and divide by how many numbers there are
-    return sum(numbers) / len(numbers)
+    # Numbers can be added up as they are, in one C loop without building a separate list of floats first.
+    # sum() refuses strings straight away, so in that case (or a mix of strings and numbers)
+    # everything is converted with map(float, ...) as sum() asks for it.
+    try:
+        total = sum(weather_data)
+    except TypeError:
+        total = sum(map(float, weather_data))
+    # Add up all the numbers and divide by how many numbers there are.
+    # float() makes sure the answer is a float even for other number types such as Decimal.
+    return float(total) / len(weather_data)
     
 # # Testing calculate_mean function
 # example = [51.0, 58.2, 59.9, 52.4, 52.1, 48.4, 47.8, 53.43]
@@ -79,6 +116,25 @@ def calculate_mean(weather_data):
 
 
 
+def load_data_from_csv_iter(csv_file):
+    """Reads a csv file one line at a time.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A generator of lists, where each list is a (non-empty) line in the csv file.
+    """
+    # csv.reader hands over one row at a time as they are asked for, so only one line is in memory at once
+    with open(csv_file, "r", newline="") as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader, None)  # Skip header row - this was causing ValueError.
+        for row in reader:
+            # Skip empty or incomplete rows
+            if len(row) >= 3:
+                # Makes sure to convert temperature strings to integers
+                yield [row[0], int(row[1]), int(row[2])]
+
+
 def load_data_from_csv(csv_file):
     """Reads a csv file and stores the data in a list.
 
@@ -87,17 +143,39 @@ def load_data_from_csv(csv_file):
     Returns:
         A list of lists, where each sublist is a (non-empty) line in the csv file.
     """
-    with open(csv_file, "r") as csvfile:
+    return list(load_data_from_csv_iter(csv_file))
+
+
+def load_columns_from_csv(csv_file):
+    """Reads a csv file and stores each column separately.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A tuple of three columns: a list of dates, then an array('i') each of minimum and maximum temperatures.
+        Position i in each column belongs to the i-th (non-empty) line in the csv file.
+        The columns can be passed straight to generate_summary_from_columns or generate_daily_summary_from_columns.
+    """
+    # One column per field instead of one small list per row - much less memory
+    # for big files, and each column can be handed straight to map()/min()/max().
+    # Each row goes straight into the columns, so the file is never held as a list of rows.
+    # array("i") stores the temperatures as plain 4-byte C ints packed side by side,
+    # rather than a full Python int object (about 28 bytes) per value like a list would.
+    dates = []
+    min_temps = array("i")
+    max_temps = array("i")
+
+    with open(csv_file, "r", newline="") as csvfile:
         reader = csv.reader(csvfile)
-        next(reader, None)  # Skip header row - this was causing ValueError.
-        data = [
-            # Makes sure to convert temperature strings to integers
-            [row[0], int(row[1]), int(row[2])]
-            for row in reader
+        next(reader, None)  # Skip header row
+        for row in reader:
             # Skip empty or incomplete rows
-            if row and len(row) >= 3
-        ]
-    return data
+            if len(row) >= 3:
+                dates.append(row[0])
+                min_temps.append(int(row[1]))
+                max_temps.append(int(row[2]))
+
+    return dates, min_temps, max_temps
 
 
 
@@ -105,62 +183,68 @@ def find_min(weather_data):
     """Calculates the minimum value in a list of numbers.
 
     Args:
-        weather_data: A list of numbers.
+        weather_data: A list (or any iterable) of numbers or numeric strings.
     Returns:
         The minimum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
     """
 
+    # Finding the position below needs a list-like input, so anything else (e.g. an iterator) is turned into a list first
+    if not isinstance(weather_data, Sequence):
+        weather_data = list(weather_data)
+
     # Guard clause handling empty list
     # If weather_data is empty (has no elements), then not weather_data is True.
     if not weather_data:
         return ()
-    
-    # Uses list comprehension again - quick way to build a new list in one line which is assigns to 'temp_float'
-    # Convert all values to float for comparison
-    temps_float = [float(value) for value in weather_data]
-
-    # find min value using built-in min() function
-    min_value = min(temps_float)
 
-    # Find last index where min_value appears
+    # Numbers (e.g. from convert_f_to_c) can be compared as they are, which saves building a whole new list.
+    # min() refuses a mix of strings and numbers, and on strings alone it would compare them like words ("100" < "49"),
+    # so in both cases everything is converted to float first and we look again.
+    try:
+        min_value = min(weather_data)
+    except TypeError:
+        min_value = None
+    if not isinstance(min_value, (int, float)):
+        # Uses list comprehension again - quick way to build a new list in one line
+        weather_data = [float(value) for value in weather_data]
+        min_value = min(weather_data)
 
-# This loop starts from the end of the list and goes backwards toward the start.
-# len(temps_float) - 1 is the index of the last element. -1 means “stop before index -1,” so it includes index 0.
-# -1 as the step means “go backwards.”
-# So it loops through indexes like [last, last-1, ..., 0].
+    # Find last index where min_value appears.
+    # weather_data[::-1] is a reversed copy, so .index() finds the first match from the end,
+    # which is the *last* match in the original. Both min() and .index() search in C, with no Python loop.
+    min_index = len(weather_data) - 1 - weather_data[::-1].index(min_value)
 
-    for i in range(len(temps_float) - 1, -1, -1):
-        # So I'm comparing each element (from the end to the start) to the minimum value in the list.
-        # This lets me find the last time that minimum appears.
-        if temps_float[i] == min_value:
-            return (min_value), i
+    return float(min_value), min_index
 
 
 def find_max(weather_data):
     """Calculates the maximum value in a list of numbers.
 
     Args:
-        weather_data: A list of numbers.
+        weather_data: A list (or any iterable) of numbers or numeric strings.
     Returns:
         The maximum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
     """
 
+    if not isinstance(weather_data, Sequence):
+        weather_data = list(weather_data)
+
     if not weather_data:
         return ()
-    # Uses list comprehension again - quick way to build a new list in one line which is assigns to 'temp_float'
-    # Convert all values to float for comparison as it loops through
-    temps_float = [float(value) for value in weather_data]
 
-    # find max value using built-in max() function
-    max_value = max(temps_float)
+    # Same as find_min: compare numbers as they are, and convert to float for strings or a mix of types
+    try:
+        max_value = max(weather_data)
+    except TypeError:
+        max_value = None
+    if not isinstance(max_value, (int, float)):
+        weather_data = [float(value) for value in weather_data]
+        max_value = max(weather_data)
+
+    # Same trick as find_min: searching the reversed copy gives the *last* position of the maximum
+    max_index = len(weather_data) - 1 - weather_data[::-1].index(max_value)
 
-    for num in range(len(temps_float) - 1, -1, -1):
-        # So I'm comparing each element (from the end to the start) to the maximum value in the list.
-        # This lets me find the last time that maximum appears.
-        # At each step, we check whether the current element equals the maximum value we found earlier.
-        # If it does, we immediately return it.
-        if temps_float[num] == max_value:
-            return max_value, num  
+    return float(max_value), max_index
 
 
 def generate_summary(weather_data):
@@ -175,71 +259,193 @@ def generate_summary(weather_data):
     # not really necessary, but keeping for consistency with other functions
     if not weather_data:
         return "No weather data available.\n"
-    
-    # counts how many sublists (days) are in the weather_data list
+
+    # zip(*...) turns the list of days into three columns (dates, mins, maxes) in one go.
+    # day[:3] keeps just those three fields, so rows with extra columns still work.
+    return generate_summary_from_columns(*zip(*(day[:3] for day in weather_data)))
+
+
+def generate_summary_from_columns(dates, min_temps, max_temps):
+    """Outputs a summary for weather data stored one column per field, as returned by load_columns_from_csv.
+
+    Args:
+        dates: A list of ISO date strings, one per day.
+        min_temps: The minimum temperature (in Fahrenheit) for each day.
+        max_temps: The maximum temperature (in Fahrenheit) for each day.
+    Returns:
+        A string containing the summary information.
+    """
+    if not dates:
+        return "No weather data available.\n"
+
+    # counts how many days there are
     # It will be used later in summary header
-    num_days = len(weather_data)
+    num_days = len(dates)
 
-    # Extract min and max temperatures directly (already in Celsius) using list comprehension (short loops that transform data)
-    min_temps = [convert_f_to_c(day[1]) for day in weather_data]
-    max_temps = [convert_f_to_c(day[2]) for day in weather_data]
+    # map() runs convert_f_to_c over a whole column at once instead of indexing each day in a Python loop
+    min_temps = list(map(convert_f_to_c, min_temps))
+    max_temps = list(map(convert_f_to_c, max_temps))
 
     # Find lowest and highest temps and their last positions
     min_temp, min_index = find_min(min_temps)
     max_temp, max_index = find_max(max_temps)
 
     # Get corresponding dates for those temps
-    min_date = convert_date(weather_data[min_index][0])
+    min_date = convert_date(dates[min_index])
     # Make sure it is in a readable format
-    max_date = convert_date(weather_data[max_index][0])
+    max_date = convert_date(dates[max_index])
 
     # Calculate averages using my own helper function
     avg_low = calculate_mean(min_temps)
     avg_high = calculate_mean(max_temps)
 
-    # Build the summary string
-    summary = (
+    return _format_summary(num_days, min_temp, min_date, max_temp, max_date, avg_low, avg_high)
+
+
+def _format_summary(num_days, min_temp, min_date, max_temp, max_date, avg_low, avg_high):
+    """Builds the overview text shared by generate_summary and summarize_stream.
+
+    Args:
+        num_days: How many days the summary covers.
+        min_temp, max_temp: The lowest and highest temperatures in degrees Celcius.
+        min_date, max_date: The readable dates those temperatures occur on.
+        avg_low, avg_high: The average low and high temperatures in degrees Celcius.
+    Returns:
+        A string containing the summary information.
+    """
+    # Build the summary string. The :.1f format specs round the temperatures the same way
+    # format_temperature does, without an extra function call for each one.
+    return (
         f"{num_days} Day Overview\n"
-        f"  The lowest temperature will be {format_temperature(min_temp)}, and will occur on {min_date}.\n"
-        f"  The highest temperature will be {format_temperature(max_temp)}, and will occur on {max_date}.\n"
-        f"  The average low this week is {format_temperature(round(avg_low, 1))}.\n"
-        f"  The average high this week is {format_temperature(round(avg_high, 1))}.\n"
+        f"  The lowest temperature will be {min_temp:.1f}{DEGREE_SYMBOL}, and will occur on {min_date}.\n"
+        f"  The highest temperature will be {max_temp:.1f}{DEGREE_SYMBOL}, and will occur on {max_date}.\n"
+        f"  The average low this week is {avg_low:.1f}{DEGREE_SYMBOL}.\n"
+        f"  The average high this week is {avg_high:.1f}{DEGREE_SYMBOL}.\n"
     )
 
-    return summary
-
-def generate_daily_summary(weather_data):
+def generate_daily_summary(weather_data, parallel=False):
     """Outputs a daily summary for the given weather data.
 
     Args:
         weather_data: A list of lists, where each sublist represents a day of weather data.
+        parallel: If True, very large inputs are formatted across several processes
+            (see generate_daily_summary_from_columns).
     Returns:
         A string containing the summary information.
     """
     if not weather_data:
         return "No daily weather data available.\n"
 
-    # Initializes an empty list to store the daily summaries.
-    # We’ll build one string per day, then join them all at the end.
-    summary_lines = []
+    # Split the days into columns (dates, mins, maxes) in one go, the same way generate_summary does
+    return generate_daily_summary_from_columns(*zip(*(day[:3] for day in weather_data)), parallel=parallel)
+
+
+def generate_daily_summary_from_columns(dates, min_temps, max_temps, parallel=False):
+    """Outputs a daily summary for weather data stored one column per field, as returned by load_columns_from_csv.
+
+    Args:
+        dates: A list of ISO date strings, one per day.
+        min_temps: The minimum temperature (in Fahrenheit) for each day.
+        max_temps: The maximum temperature (in Fahrenheit) for each day.
+        parallel: If True, inputs of at least PARALLEL_DAILY_SUMMARY_THRESHOLD days are formatted in a
+            pool of processes, one per CPU. On macOS and Windows this needs the calling script to be
+            guarded by if __name__ == "__main__". Has no effect on a single-CPU machine.
+    Returns:
+        A string containing the summary information.
+    """
+    if not dates:
+        return "No daily weather data available.\n"
+
+    # Processes are only started when asked for, there is more than one CPU to share the work,
+    # and there are enough days to make up for the cost of starting them
+    workers = os.cpu_count() or 1
+    if not parallel or workers <= 1 or len(dates) < PARALLEL_DAILY_SUMMARY_THRESHOLD:
+        return _format_days(dates, min_temps, max_temps)
+
+    # Every day is formatted on its own, so big inputs can be cut into one chunk per CPU
+    # and formatted in separate processes. map() hands the chunks back in order.
+    chunk_size = -(-len(dates) // workers)  # rounds up, so no days are left over
+    starts = range(0, len(dates), chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return "".join(executor.map(
+            _format_days,
+            [dates[i:i + chunk_size] for i in starts],
+            [min_temps[i:i + chunk_size] for i in starts],
+            [max_temps[i:i + chunk_size] for i in starts],
+        ))
+
 
-    # Iterate over each day's data in the weather_data list.
-    for day in weather_data:
-        # Getting the date using the first element of the sublist (day[0]) and our convert_date function to make it readable.
-        date = convert_date(day[0])
-        min_c = format_temperature(convert_f_to_c(day[1]))
-        max_c = format_temperature(convert_f_to_c(day[2]))
+def _format_days(dates, min_temps, max_temps):
+    """Builds the daily summary blocks for (non-empty) columns of weather data.
 
-        daily_summary = (
-            f"---- {date} ----\n"
-            f"  Minimum Temperature: {min_c}\n"
-            f"  Maximum Temperature: {max_c}\n"
-        )
+    Args:
+        dates: A list of ISO date strings, one per day.
+        min_temps: The minimum temperature (in Fahrenheit) for each day.
+        max_temps: The maximum temperature (in Fahrenheit) for each day.
+    Returns:
+        A string with one block per day, each followed by a blank line.
+    """
+    # Convert each whole column in one pass with map(), the same way generate_summary does.
+    readable_dates = map(convert_date, dates)
+    min_temps = map(convert_f_to_c, min_temps)
+    max_temps = map(convert_f_to_c, max_temps)
+
+    # Build every day's block with a single f-string each. The :.1f format spec does the
+    # same job as format_temperature without an extra function call per temperature.
+    # Each block ends with a blank line, so chunks formatted separately can just be stuck together.
+    return "".join(
+        f"---- {day_date} ----\n"
+        f"  Minimum Temperature: {min_c:.1f}{DEGREE_SYMBOL}\n"
+        f"  Maximum Temperature: {max_c:.1f}{DEGREE_SYMBOL}\n\n"
+        for day_date, min_c, max_c in zip(readable_dates, min_temps, max_temps)
+    )
 
-        summary_lines.append(daily_summary)
-    # takes all the strings in the list and connects them with a newline between each.
 
-    # change to f string 
+def summarize_stream(csv_file):
+    """Outputs a summary for the weather data in a csv file, reading it one line at a time.
 
-    return f"{'\n'.join(summary_lines)}\n"
+    Gives the same result as generate_summary(load_data_from_csv(csv_file)), but never keeps
+    more than one line of the file in memory, so it also works for very large files.
 
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A string containing the summary information.
+    """
+    num_days = 0
+    min_temp = float("inf")
+    max_temp = float("-inf")
+    min_date = max_date = ""
+    low_total = high_total = 0.0
+
+    # A local name is quicker to look up than a module-level one inside the loop
+    to_celsius = convert_f_to_c
+
+    # load_data_from_csv_iter hands over one day at a time, so nothing is stored as we go
+    for day in load_data_from_csv_iter(csv_file):
+        day_min = to_celsius(day[1])
+        day_max = to_celsius(day[2])
+
+        # <= and >= (rather than < and >) keep moving to later days on a tie,
+        # so we end up with the *last* occurrence just like find_min/find_max.
+        if day_min <= min_temp:
+            min_temp = day_min
+            min_date = day[0]
+        if day_max >= max_temp:
+            max_temp = day_max
+            max_date = day[0]
+
+        # Keep running totals so the averages can be worked out at the end without storing every day
+        low_total += day_min
+        high_total += day_max
+        num_days += 1
+
+    if not num_days:
+        return "No weather data available.\n"
+
+    return _format_summary(
+        num_days,
+        min_temp, convert_date(min_date),
+        max_temp, convert_date(max_date),
+        low_total / num_days, high_total / num_days,
+    )